@@ -55,7 +55,7 @@ fee_analysis = df.groupby('fee_bracket').agg({
 }).round(2)
 
 logger.info("\nEfficiency by Fee Bracket:")
-print(fee_analysis)
+logger.info(f"\n{fee_analysis}")
 
 # ============================================================================
 # 2. POSITION ANALYSIS
@@ -75,7 +75,7 @@ position_analysis = df.groupby('position').agg({
 position_analysis = position_analysis.sort_values(('efficiency_score', 'mean'), ascending=False)
 logger.info("\nEfficiency by Position:")
 if len(position_analysis) > 0:
-    print(position_analysis.head(10))
+    logger.info(f"\n{position_analysis.head(10)}")
 else:
     logger.warning("No position data available")
 
@@ -96,7 +96,7 @@ league_analysis = df[df['league'] != 'Unknown'].groupby('league').agg({
 
 league_analysis = league_analysis.sort_values(('efficiency_score', 'mean'), ascending=False)
 logger.info("\nEfficiency by League:")
-print(league_analysis)
+logger.info(f"\n{league_analysis}")
 
 # ============================================================================
 # 4. AGE GROUP ANALYSIS
@@ -120,7 +120,7 @@ age_analysis = df.groupby('age_group').agg({
 }).round(2)
 
 logger.info("\nEfficiency by Age Group:")
-print(age_analysis)
+logger.info(f"\n{age_analysis}")
 
 # ============================================================================
 # 5. SAVE ANALYSIS RESULTS
@@ -0,0 +1,292 @@
+"""
+Nearest-Neighbour Comparable Transfers Index
+Finds past transfers similar to a given one by fee, age, output, position and league
+"""
+
+import pandas as pd
+import numpy as np
+import joblib
+import logging
+from pathlib import Path
+from sklearn.neighbors import KDTree
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+METRICS_PATH = 'data/processed/transfer_efficiency_metrics.csv'
+INDEX_PATH = 'data/processed/transfer_comparables_index.joblib'
+
+# Features used to measure similarity between transfers
+NUMERIC_FEATURES = [
+    'fee_millions', 'age',
+    'perf_after_goals', 'perf_after_assists', 'perf_after_minutes'
+]
+CATEGORICAL_FEATURES = ['position', 'league']
+
+# Columns returned for each neighbour
+NEIGHBOUR_COLUMNS = [
+    'player_name', 'club_name', 'position', 'league', 'season', 'age',
+    'fee_millions', 'perf_after_goals', 'perf_after_assists',
+    'efficiency_score', 'efficiency_category'
+]
+
+# Inserted transfers are searched by brute force until this many accumulate,
+# then the tree is rebuilt over the full table
+REBUILD_THRESHOLD = 1000
+
+
+class ComparablesIndex:
+    """
+    KD-tree over standardized numeric features and one-hot position/league.
+
+    Standardization statistics and category vocabularies are fixed when the
+    index is built, so inserted transfers and queries share the same space.
+    """
+
+    def __init__(self, transfers, leaf_size=40, rebuild_threshold=REBUILD_THRESHOLD):
+        if 'efficiency_score' not in transfers.columns:
+            raise ValueError("Transfers must be scored (missing 'efficiency_score')")
+
+        self.numeric_features = [c for c in NUMERIC_FEATURES if c in transfers.columns]
+        self.categorical_features = [c for c in CATEGORICAL_FEATURES if c in transfers.columns]
+        self.leaf_size = leaf_size
+        self.rebuild_threshold = rebuild_threshold
+
+        self.transfers = transfers.reset_index(drop=True)
+        self._fit(self.transfers)
+        self._features = self._encode(self.transfers)
+        self._clear_pending()
+        self._build_tree()
+
+    def __len__(self):
+        return self._tree_size + self._pending_size
+
+    def _fit(self, transfers):
+        """Fit standardization statistics and category vocabularies."""
+        numeric = transfers[self.numeric_features].astype(float)
+        self.means = numeric.mean()
+        self.stds = numeric.std(ddof=0).replace(0, 1.0).fillna(1.0)
+        self.categories = {
+            col: np.array(sorted(transfers[col].fillna('Unknown').astype(str).unique()))
+            for col in self.categorical_features
+        }
+
+    def _encode(self, transfers):
+        """
+        Map transfers to the standardized feature space of the index.
+
+        Missing numeric columns (e.g. post-transfer output for a prospective
+        signing) are treated as NaN and filled with the index means.
+        """
+        missing = [c for c in self.categorical_features if c not in transfers.columns]
+        if missing:
+            raise ValueError(f"Transfers are missing feature columns: {missing}")
+
+        numeric = (
+            transfers.reindex(columns=self.numeric_features)
+            .astype(float)
+            .fillna(self.means)
+        )
+        parts = [((numeric - self.means) / self.stds).to_numpy()]
+
+        # Unseen categories encode as all zeros
+        for col, categories in self.categories.items():
+            values = transfers[col].fillna('Unknown').astype(str).to_numpy()
+            parts.append((values[:, None] == categories[None, :]).astype(float))
+
+        return np.hstack(parts)
+
+    def _build_tree(self):
+        self._tree = KDTree(self._features, leaf_size=self.leaf_size)
+        self._tree_size = len(self._features)
+
+    def _clear_pending(self):
+        self._pending_features = []
+        self._pending_transfers = []
+        self._pending_size = 0
+        self._pending_cache = None
+
+    def _pending(self):
+        """Pending insertions as one feature matrix and one table (cached)."""
+        if self._pending_cache is None:
+            self._pending_cache = (
+                np.vstack(self._pending_features),
+                pd.concat(self._pending_transfers, ignore_index=True),
+            )
+        return self._pending_cache
+
+    def _merge_pending(self):
+        if self._pending_size == 0:
+            return
+        _, transfers = self._pending()
+        self.transfers = pd.concat([self.transfers, transfers], ignore_index=True)
+        self._clear_pending()
+
+        # Refit so transfers from new leagues/positions get their own encoding
+        self._fit(self.transfers)
+        self._features = self._encode(self.transfers)
+
+    def insert(self, transfers):
+        """
+        Add new scored transfers.
+
+        New rows are held in a pending buffer and merged into the main table
+        (and the tree rebuilt) only once the buffer reaches `rebuild_threshold`.
+        """
+        if 'efficiency_score' not in transfers.columns:
+            raise ValueError("Transfers must be scored (missing 'efficiency_score')")
+
+        for col, categories in self.categories.items():
+            unseen = set(transfers[col].fillna('Unknown').astype(str)) - set(categories)
+            if unseen:
+                logger.warning(
+                    f"Unknown {col} values {sorted(unseen)} encode as all zeros "
+                    f"until the next rebuild"
+                )
+
+        self._pending_features.append(self._encode(transfers))
+        self._pending_transfers.append(transfers.reset_index(drop=True))
+        self._pending_size += len(transfers)
+        self._pending_cache = None
+
+        if self._pending_size >= self.rebuild_threshold:
+            self._merge_pending()
+            logger.info(f"Rebuilding comparables tree over {len(self._features)} transfers")
+            self._build_tree()
+
+    def query(self, transfers, k=5):
+        """
+        Batched k-NN lookup.
+
+        Returns one row per (query, neighbour) with the neighbour's details,
+        its efficiency score and its distance in standardized feature space.
+        """
+        k = min(k, len(self))
+        X = self._encode(transfers)
+
+        distances, indices = self._tree.query(X, k=min(k, self._tree_size))
+
+        # Merge tree results with a brute-force pass over pending insertions;
+        # pending rows are numbered after the tree rows
+        if self._pending_size > 0:
+            pending, pending_transfers = self._pending()
+            squared = (
+                (X ** 2).sum(axis=1)[:, None]
+                - 2 * X @ pending.T
+                + (pending ** 2).sum(axis=1)[None, :]
+            )
+            pending_distances = np.sqrt(np.clip(squared, 0, None))
+            pending_indices = np.broadcast_to(
+                np.arange(self._tree_size, len(self)), pending_distances.shape
+            )
+            distances = np.hstack([distances, pending_distances])
+            indices = np.hstack([indices, pending_indices])
+            order = np.argsort(distances, axis=1, kind='stable')[:, :k]
+            distances = np.take_along_axis(distances, order, axis=1)
+            indices = np.take_along_axis(indices, order, axis=1)
+
+        flat = indices.ravel()
+        in_tree = flat < self._tree_size
+        neighbour_cols = [c for c in NEIGHBOUR_COLUMNS if c in self.transfers.columns]
+        neighbours = self.transfers.iloc[flat[in_tree]][neighbour_cols]
+        if not in_tree.all():
+            from_pending = pending_transfers.iloc[flat[~in_tree] - self._tree_size]
+            neighbours = pd.concat([neighbours, from_pending.reindex(columns=neighbour_cols)])
+            positions = np.concatenate([np.flatnonzero(in_tree), np.flatnonzero(~in_tree)])
+            neighbours = neighbours.iloc[np.argsort(positions, kind='stable')]
+
+        neighbours = neighbours.reset_index(drop=True)
+        neighbours.insert(0, 'query_index', np.repeat(transfers.index.to_numpy(), k))
+        neighbours.insert(1, 'rank', np.tile(np.arange(1, k + 1), len(X)))
+        neighbours.insert(2, 'distance', distances.ravel())
+        return neighbours
+
+    def save(self, path=INDEX_PATH):
+        """
+        Persist plain state rather than the object or the fitted tree, so the
+        file loads from any script and across scikit-learn versions.
+        """
+        features, transfers = self._features, self.transfers
+        if self._pending_size > 0:
+            pending_features, pending_transfers = self._pending()
+            features = np.vstack([features, pending_features])
+            transfers = pd.concat([transfers, pending_transfers], ignore_index=True)
+
+        state = {
+            'numeric_features': self.numeric_features,
+            'categorical_features': self.categorical_features,
+            'means': self.means,
+            'stds': self.stds,
+            'categories': self.categories,
+            'transfers': transfers,
+            '_features': features,
+            '_tree_size': self._tree_size,
+            'leaf_size': self.leaf_size,
+            'rebuild_threshold': self.rebuild_threshold,
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(state, path)
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild an index from the dict written by `save`."""
+        index = cls.__new__(cls)
+        for key in ('numeric_features', 'categorical_features', 'means', 'stds',
+                    'categories', 'leaf_size', 'rebuild_threshold'):
+            setattr(index, key, state[key])
+
+        # Rows saved while still pending go back into the pending buffer
+        tree_size = state['_tree_size']
+        index.transfers = state['transfers'].iloc[:tree_size].reset_index(drop=True)
+        index._features = state['_features'][:tree_size]
+        index._clear_pending()
+        if len(state['_features']) > tree_size:
+            index._pending_features.append(state['_features'][tree_size:])
+            index._pending_transfers.append(
+                state['transfers'].iloc[tree_size:].reset_index(drop=True)
+            )
+            index._pending_size = len(state['_features']) - tree_size
+        index._build_tree()
+        return index
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        return cls.from_state(joblib.load(path))
+
+
+if __name__ == '__main__':
+    logger.info("="*80)
+    logger.info("BUILDING COMPARABLE TRANSFERS INDEX")
+    logger.info("="*80)
+
+    df = pd.read_csv(METRICS_PATH)
+    logger.info(f"\nLoaded {len(df)} scored transfers")
+
+    index = ComparablesIndex(df)
+    logger.info(f"Numeric features: {index.numeric_features}")
+    logger.info(f"Categorical features: {index.categorical_features}")
+
+    index.save(INDEX_PATH)
+    logger.info(f"\n✅ Saved comparables index to: {INDEX_PATH}")
+
+    # Example: comparables for the most efficient transfer
+    logger.info("\n" + "="*80)
+    logger.info("COMPARABLES FOR THE MOST EFFICIENT TRANSFER")
+    logger.info("="*80)
+
+    target = df.nlargest(1, 'efficiency_score')
+    comparables = index.query(target, k=10)
+
+    # Drop the target itself, wherever it lands among tied neighbours
+    key_cols = [c for c in ['player_name', 'club_name', 'season'] if c in comparables.columns]
+    is_target = (comparables[key_cols] == target[key_cols].iloc[0]).all(axis=1)
+    comparables = comparables[~is_target].head(5)
+
+    for rank, (_, row) in enumerate(comparables.iterrows(), start=1):
+        logger.info(f"\n{rank}. {row['player_name']} → {row['club_name']}")
+        logger.info(f"   Fee: €{row['fee_millions']:.1f}M | Distance: {row['distance']:.3f}")
+        logger.info(f"   Efficiency Score: {row['efficiency_score']:.2f}")
+
+    logger.info("\n" + "="*80)
+    logger.info("COMPARABLES INDEX COMPLETE!")
+    logger.info("="*80)
@@ -0,0 +1,181 @@
+"""
+Generate Efficiency Reports from Precomputed Aggregates
+Writes one Excel workbook (one sheet per breakdown plus the scored transfer list)
+and renders the Markdown report from the same aggregates
+"""
+
+import pandas as pd
+import json
+import logging
+from datetime import date
+from pathlib import Path
+from string import Template
+from openpyxl import Workbook
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+METRICS_PATH = 'data/processed/transfer_efficiency_metrics.csv'
+SUMMARY_PATH = 'results/efficiency_summary.json'
+WORKBOOK_PATH = 'results/reports/efficiency_report.xlsx'
+MARKDOWN_PATH = 'results/reports/EFFICIENCY_REPORT.md'
+TEMPLATE_PATH = Path(__file__).parent / 'templates' / 'efficiency_report.md'
+
+# Sheet name -> aggregate CSV written by comprehensive_efficiency_analysis.py
+BREAKDOWNS = {
+    'Fee Bracket': 'results/efficiency_by_fee_bracket.csv',
+    'League': 'results/efficiency_by_league.csv',
+    'Position': 'results/efficiency_by_position.csv',
+    'Age Group': 'results/efficiency_by_age_group.csv',
+}
+
+# Excel's hard row limit; longer tables continue on a new sheet
+MAX_SHEET_ROWS = 1_048_576
+CHUNK_SIZE = 50_000
+
+# Summary fields rendered as €M amounts in the Markdown report
+CURRENCY_FIELDS = {'avg_fee', 'median_fee', 'avg_cost_per_goal', 'avg_cost_per_contribution'}
+
+TOP_TRANSFER_COLUMNS = [
+    'player_name', 'club_name', 'fee_millions', 'perf_after_goals',
+    'perf_after_assists', 'efficiency_score', 'efficiency_category'
+]
+
+
+def load_breakdown(path):
+    """Read a groupby aggregate saved with two-level column headers."""
+    breakdown = pd.read_csv(path, header=[0, 1], index_col=0)
+    breakdown.columns = [f'{metric}_{stat}' for metric, stat in breakdown.columns]
+    return breakdown.reset_index()
+
+
+def _excel_rows(frame):
+    """Yield rows as plain Python values, with NaN written as empty cells."""
+    frame = frame.astype(object).where(frame.notna(), None)
+    return frame.itertuples(index=False, name=None)
+
+
+def write_breakdown_sheet(workbook, title, breakdown):
+    sheet = workbook.create_sheet(title)
+    sheet.append(list(breakdown.columns))
+    for row in _excel_rows(breakdown):
+        sheet.append(row)
+
+
+def write_transfer_sheets(workbook, path, title='Transfers', top_n=10):
+    """
+    Stream the scored transfer list into write-only sheets chunk by chunk.
+
+    Returns the total row count and the `top_n` most efficient transfers,
+    collected during the same pass so the table is never fully in memory.
+    """
+    # The first sheet and header are written up front, so a header-only
+    # CSV still produces an (empty) Transfers sheet
+    top = pd.read_csv(path, nrows=0)
+    columns = list(top.columns)
+    sheet = workbook.create_sheet(title)
+    sheet.append(columns)
+    sheet_rows, n_sheets = 1, 1
+    total_rows = 0
+
+    for chunk in pd.read_csv(path, chunksize=CHUNK_SIZE):
+        if chunk.empty:
+            continue
+        for row in _excel_rows(chunk):
+            if sheet_rows >= MAX_SHEET_ROWS:
+                n_sheets += 1
+                sheet = workbook.create_sheet(f'{title} ({n_sheets})')
+                sheet.append(columns)
+                sheet_rows = 1
+            sheet.append(row)
+            sheet_rows += 1
+
+        total_rows += len(chunk)
+        top = chunk if top.empty else pd.concat([top, chunk])
+        top = top.nlargest(top_n, 'efficiency_score')
+
+    return total_rows, top
+
+
+def write_workbook(summary, breakdowns, path=WORKBOOK_PATH, metrics_path=METRICS_PATH):
+    # Write-only mode streams rows to disk instead of holding cells in memory
+    workbook = Workbook(write_only=True)
+
+    sheet = workbook.create_sheet('Summary')
+    sheet.append(['metric', 'value'])
+    for metric, value in summary.items():
+        sheet.append([metric, value])
+
+    for title, breakdown in breakdowns.items():
+        write_breakdown_sheet(workbook, title, breakdown)
+
+    total_rows, top = write_transfer_sheets(workbook, metrics_path)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    workbook.save(path)
+    return total_rows, top
+
+
+def markdown_table(frame, float_format='{:.2f}'):
+    def fmt(value):
+        if pd.isna(value):
+            return '-'
+        if isinstance(value, float):
+            return float_format.format(value)
+        return str(value)
+
+    lines = [
+        '| ' + ' | '.join(str(c) for c in frame.columns) + ' |',
+        '|' + '|'.join('---' for _ in frame.columns) + '|',
+    ]
+    for row in frame.itertuples(index=False, name=None):
+        lines.append('| ' + ' | '.join(fmt(v) for v in row) + ' |')
+    return '\n'.join(lines)
+
+
+def render_markdown(summary, breakdowns, top, path=MARKDOWN_PATH):
+    template = Template(TEMPLATE_PATH.read_text(encoding='utf-8'))
+
+    def fmt(key, value):
+        if isinstance(value, float):
+            if pd.isna(value):
+                return '-'
+            value = f'{value:.2f}'
+        return f'€{value}M' if key in CURRENCY_FIELDS else value
+
+    values = {key: fmt(key, value) for key, value in summary.items()}
+    values['generated_date'] = date.today().strftime('%B %d, %Y')
+    values['fee_bracket_table'] = markdown_table(breakdowns['Fee Bracket'])
+    values['league_table'] = markdown_table(breakdowns['League'])
+    values['position_table'] = markdown_table(breakdowns['Position'])
+    values['age_group_table'] = markdown_table(breakdowns['Age Group'])
+
+    top_cols = [c for c in TOP_TRANSFER_COLUMNS if c in top.columns]
+    values['top_transfers_table'] = markdown_table(top[top_cols])
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(template.substitute(values), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    logger.info("="*80)
+    logger.info("GENERATING EFFICIENCY REPORTS")
+    logger.info("="*80)
+
+    with open(SUMMARY_PATH) as f:
+        summary = json.load(f)
+
+    breakdowns = {title: load_breakdown(path) for title, path in BREAKDOWNS.items()}
+    logger.info(f"\nLoaded {len(breakdowns)} breakdowns and summary statistics")
+
+    total_rows, top = write_workbook(summary, breakdowns)
+    logger.info(f"\n✅ Saved workbook to: {WORKBOOK_PATH}")
+    logger.info(f"   Sheets: Summary, {', '.join(breakdowns)}, Transfers")
+    logger.info(f"   Transfer rows: {total_rows}")
+
+    render_markdown(summary, breakdowns, top)
+    logger.info(f"\n✅ Saved Markdown report to: {MARKDOWN_PATH}")
+
+    logger.info("\n" + "="*80)
+    logger.info("REPORT GENERATION COMPLETE!")
+    logger.info("="*80)
@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src' / 'optimization'))
+
+from recruitment_optimizer import solve, solve_greedy, solve_ilp  # noqa: E402
+
+POSITIONS = np.array(['Forward', 'Midfielder', 'Defender', 'Goalkeeper'])
+
+
+def random_problem(seed, pool_size=12):
+    rng = np.random.default_rng(seed)
+    pool = pd.DataFrame({
+        'fee_millions': rng.choice([0.0, 0.5, 1, 2, 5, 8, 15, 30], pool_size),
+        'position': rng.choice(POSITIONS, pool_size),
+        'performance_index': rng.exponential(50, pool_size),
+    })
+    budget = float(rng.choice([5, 10, 20, 40]))
+    squad_slots = int(rng.integers(2, 6))
+    position_needs = {
+        p: int(n) for p, n in zip(POSITIONS[:3], rng.integers(0, 2, 3)) if n > 0
+    }
+    return pool, budget, squad_slots, position_needs
+
+
+def assert_respects_constraints(result, budget, squad_slots, position_needs):
+    selected = result['selected']
+    assert selected['fee_millions'].sum() <= budget + 1e-9
+    assert len(selected) <= squad_slots
+    for position, need in position_needs.items():
+        assert (selected['position'] == position).sum() >= need
+
+
+def test_greedy_reserve_skips_chosen_candidates():
+    candidates = pd.DataFrame({
+        'fee_millions': [1, 8, 2, 1],
+        'position': ['Forward', 'Defender', 'Forward', 'Defender'],
+        'performance_index': [1000, 500, 1, 0.1],
+    })
+    needs = {'Forward': 2, 'Defender': 1}
+
+    result = solve_greedy(candidates, 10, 3, needs)
+
+    assert result['status'] == 'Feasible'
+    assert result['total_fee'] == 4
+    assert_respects_constraints(result, 10, 3, needs)
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_greedy_matches_ilp_feasibility_and_bounds(seed):
+    pool, budget, squad_slots, position_needs = random_problem(seed)
+
+    exact = solve_ilp(pool, budget, squad_slots, position_needs)
+    greedy = solve_greedy(pool, budget, squad_slots, position_needs)
+
+    if exact['status'] != 'Optimal':
+        assert greedy['status'] == 'Infeasible'
+        return
+
+    assert greedy['status'] == 'Feasible'
+    assert_respects_constraints(greedy, budget, squad_slots, position_needs)
+    assert_respects_constraints(exact, budget, squad_slots, position_needs)
+    assert greedy['total_performance'] <= exact['total_performance'] + 1e-6
+    assert exact['total_performance'] <= greedy['upper_bound'] + 1e-6
+
+
+def test_auto_returns_ilp_optimum():
+    pool, budget, squad_slots, position_needs = random_problem(seed=3, pool_size=200)
+
+    result = solve(pool, budget, squad_slots, position_needs)
+    exact = solve_ilp(pool, budget, squad_slots, position_needs)
+
+    assert result['method'] == 'ilp'
+    assert result['total_performance'] == pytest.approx(exact['total_performance'])
+
+
+def test_invalid_candidates_are_dropped():
+    candidates = pd.DataFrame({
+        'fee_millions': [1.0, -1.0, np.nan],
+        'position': ['Forward'] * 3,
+        'performance_index': [10.0, 50.0, 50.0],
+    })
+
+    result = solve(candidates, 10, 3)
+
+    assert list(result['selected'].index) == [0]
+
+
+def test_unknown_method_raises():
+    pool, budget, squad_slots, position_needs = random_problem(seed=0)
+
+    with pytest.raises(ValueError):
+        solve(pool, budget, squad_slots, position_needs, method='dp')